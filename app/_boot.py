@@ -0,0 +1,6 @@
+import time
+
+# Marca o início do boot do worker. Importado primeiro por app.main, então
+# o tempo medido cobre a importação da aplicação (FastAPI, SQLModel, rotas,
+# entidades) e o startup do lifespan, mas não o interpretador nem o uvicorn.
+BOOT_START = time.perf_counter()
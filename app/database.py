@@ -1,7 +1,8 @@
-from sqlmodel import create_engine, SQLModel, Session
+from sqlmodel import create_engine, SQLModel, Session, Field
 import sqlite3
 from dotenv import load_dotenv
-from sqlalchemy import event, Engine
+from sqlalchemy import event, inspect, Engine
+from app.migrations import MIGRATIONS
 import logging
 import os
 
@@ -13,8 +14,50 @@ logging.getLogger("sqlalchemy.engine").setLevel(logging.INFO)
 
 engine = create_engine(os.getenv("DATABASE_URL"))
 
-def create_db_and_tables():
-    SQLModel.metadata.create_all(engine)
+class SchemaVersion(SQLModel, table=True):
+    __tablename__ = "schema_version"
+    version: int = Field(primary_key=True)
+
+SCHEMA_VERSION = max(MIGRATIONS)
+
+def get_schema_version() -> int | None:
+    """
+    Retorna a versão do schema gravada no banco, ou None se a tabela
+    schema_version ainda não existe. Outros erros de banco são propagados.
+    """
+    with engine.connect() as connection:
+        if not inspect(connection).has_table(SchemaVersion.__tablename__):
+            return None
+        # SQL fixo: evita compilar um select() no boot do worker
+        return connection.exec_driver_sql(
+            f"SELECT version FROM {SchemaVersion.__tablename__}"
+        ).scalar()
+
+def migrate_db():
+    """
+    Aplica, em ordem, os passos de MIGRATIONS entre a versão atual e
+    SCHEMA_VERSION. Deve rodar uma única vez, fora dos workers
+    (`python -m app.migrate`).
+    """
+    current = get_schema_version() or 0
+    for version in range(current + 1, SCHEMA_VERSION + 1):
+        with engine.begin() as connection:
+            MIGRATIONS[version](connection)
+            SchemaVersion.__table__.create(connection, checkfirst=True)
+            connection.execute(SchemaVersion.__table__.delete())
+            connection.execute(SchemaVersion.__table__.insert().values(version=version))
+
+def check_schema():
+    """
+    Verifica se o schema está atualizado, sem executar DDL.
+    Lança RuntimeError se for necessário rodar a migração.
+    """
+    current = get_schema_version()
+    if current != SCHEMA_VERSION:
+        raise RuntimeError(
+            f"Schema do banco desatualizado (atual: {current}, esperado: {SCHEMA_VERSION}). "
+            "Execute `python -m app.migrate` antes de iniciar os workers."
+        )
 
 def get_session():
     with Session(engine) as session:
@@ -25,4 +68,4 @@ def set_sqlite_pragma(dbapi_connection, connection_record):
     if type(dbapi_connection) is sqlite3.Connection:  # somente para o SQLite
        cursor = dbapi_connection.cursor()
        cursor.execute("PRAGMA foreign_keys=ON")
-       cursor.close()
\ No newline at end of file
+       cursor.close()
@@ -0,0 +1,21 @@
+"""
+Migração única do banco. Rodar antes de subir os workers:
+
+    python -m app.migrate
+"""
+import logging
+from app.database import SCHEMA_VERSION, get_schema_version, migrate_db
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+def main():
+    current = get_schema_version()
+    if current == SCHEMA_VERSION:
+        logger.info("Schema já está na versão %s, nada a fazer.", SCHEMA_VERSION)
+        return
+    migrate_db()
+    logger.info("Schema migrado da versão %s para %s.", current, SCHEMA_VERSION)
+
+if __name__ == "__main__":
+    main()
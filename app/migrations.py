@@ -0,0 +1,59 @@
+from sqlalchemy import MetaData, Table, Column, ForeignKey, Integer, Date, DateTime, Enum
+from sqlmodel.sql.sqltypes import AutoString
+
+# Retrato fixo do schema na versão 1. Não importar as entidades aqui: os
+# passos de migração não podem mudar quando os modelos mudarem.
+_v1 = MetaData()
+
+Table(
+    "collaborator", _v1,
+    Column("id", Integer, primary_key=True),
+    Column("name", AutoString, nullable=False),
+    Column("email", AutoString, nullable=False),
+)
+
+Table(
+    "project", _v1,
+    Column("id", Integer, primary_key=True),
+    Column("name", AutoString, nullable=False),
+    Column("description", AutoString),
+    Column("start_date", Date),
+    Column("end_date", Date),
+    Column("forecast_completion", Date),
+    Column("status", Enum("ONGOING", "COMPLETED", "PENDING", "CANCELLED", name="projectstatus"), nullable=False),
+    Column("created_date", DateTime(timezone=True), nullable=False),
+    Column("updated_date", DateTime(timezone=True), nullable=False),
+)
+
+Table(
+    "task", _v1,
+    Column("id", Integer, primary_key=True),
+    Column("name", AutoString, nullable=False),
+    Column("description", AutoString, nullable=False),
+    Column("delivery_forecast", Date),
+    Column("start_date", Date),
+    Column("end_date", Date),
+    Column("status", Enum("PENDING", "IN_PROGRESS", "COMPLETED", name="taskstatusenum"), nullable=False),
+    Column("project_id", Integer, ForeignKey("project.id"), nullable=False),
+)
+
+Table(
+    "assignments", _v1,
+    Column("id", Integer, primary_key=True),
+    Column("task_id", Integer, ForeignKey("task.id"), nullable=False),
+    Column("collaborator_id", Integer, ForeignKey("collaborator.id"), nullable=False),
+    Column("assignments_data", DateTime(timezone=True), nullable=False),
+)
+
+def _v1_initial_schema(connection):
+    # checkfirst: bancos criados antes do controle de versão já têm as tabelas
+    _v1.create_all(connection)
+
+# Cada versão tem o seu próprio passo de DDL, aplicado em ordem por
+# `python -m app.migrate`, tanto em bancos vazios quanto nos já existentes.
+# Um passo nunca deve ler os modelos: ao mudar uma entidade, acrescente uma
+# nova versão com o DDL explícito (ALTER TABLE, CREATE TABLE) e não altere
+# os passos anteriores.
+MIGRATIONS = {
+    1: _v1_initial_schema,
+}
@@ -0,0 +1,112 @@
+import pytest
+from sqlalchemy import MetaData, Table, Column, Integer, String, inspect
+from sqlalchemy.exc import OperationalError
+from sqlmodel import SQLModel, create_engine
+import app.database as database
+from app import migrate
+# Registra as entidades no metadata para comparar com o schema migrado
+import app.collaborator.collaborator_entity  # noqa: F401
+import app.project.project_entity  # noqa: F401
+import app.task.task_entity  # noqa: F401
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    monkeypatch.setattr(database, "engine", engine)
+    yield engine
+    engine.dispose()
+
+
+def test_check_schema_raises_on_unmigrated_db(engine):
+    with pytest.raises(RuntimeError, match="app.migrate"):
+        database.check_schema()
+
+
+def test_migrate_creates_tables_and_stamps_version(engine):
+    migrate.main()
+
+    tables = set(inspect(engine).get_table_names())
+    assert {"project", "task", "collaborator", "assignments", "schema_version"} <= tables
+    assert database.get_schema_version() == database.SCHEMA_VERSION
+    database.check_schema()
+
+
+def test_migrate_twice_is_noop(engine, monkeypatch):
+    migrate.main()
+
+    def fail():
+        raise AssertionError("migrate_db não deveria rodar com o schema atualizado")
+
+    monkeypatch.setattr(migrate, "migrate_db", fail)
+    migrate.main()
+    assert database.get_schema_version() == database.SCHEMA_VERSION
+
+
+def _columns(engine):
+    inspector = inspect(engine)
+    return {
+        table: {column["name"] for column in inspector.get_columns(table)}
+        for table in inspector.get_table_names()
+    }
+
+
+def test_migrated_schema_matches_models(engine):
+    migrate.main()
+
+    # Falha se uma entidade mudar sem a versão de migração correspondente
+    assert _columns(engine) == {
+        table.name: {column.name for column in table.columns}
+        for table in SQLModel.metadata.sorted_tables
+    }
+
+
+@pytest.fixture
+def later_versions(monkeypatch):
+    """
+    Simula uma mudança de modelo (nova coluna em task e nova tabela label)
+    acompanhada das versões 2 e 3 com o DDL explícito.
+    """
+    metadata = MetaData()
+    for table in SQLModel.metadata.sorted_tables:
+        table.to_metadata(metadata)
+    metadata.tables["task"].append_column(Column("priority", Integer))
+    Table("label", metadata, Column("id", Integer, primary_key=True), Column("name", String, nullable=False))
+    monkeypatch.setattr(SQLModel, "metadata", metadata)
+
+    def add_task_priority(connection):
+        connection.exec_driver_sql("ALTER TABLE task ADD COLUMN priority INTEGER")
+
+    def create_label(connection):
+        connection.exec_driver_sql("CREATE TABLE label (id INTEGER NOT NULL PRIMARY KEY, name VARCHAR NOT NULL)")
+
+    def register():
+        monkeypatch.setitem(database.MIGRATIONS, 2, add_task_priority)
+        monkeypatch.setitem(database.MIGRATIONS, 3, create_label)
+        monkeypatch.setattr(database, "SCHEMA_VERSION", 3)
+        monkeypatch.setattr(migrate, "SCHEMA_VERSION", 3)
+
+    return register
+
+
+@pytest.mark.parametrize("stamped_at_v1", [False, True], ids=["fresh", "stamped-v1"])
+def test_migrate_applies_later_versions(engine, later_versions, stamped_at_v1):
+    if stamped_at_v1:
+        migrate.main()
+        assert database.get_schema_version() == 1
+    later_versions()
+
+    migrate.main()
+
+    columns = _columns(engine)
+    assert "priority" in columns["task"]
+    assert columns["label"] == {"id", "name"}
+    assert database.get_schema_version() == 3
+
+
+def test_get_schema_version_propagates_other_errors(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'missing' / 'test.db'}")
+    monkeypatch.setattr(database, "engine", engine)
+
+    with pytest.raises(OperationalError):
+        database.get_schema_version()